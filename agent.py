@@ -1,6 +1,7 @@
 import sys
 import time
 import json
+import logging
 from datetime import datetime, timezone
 from typing import Any, Dict, List
 import requests
@@ -32,12 +33,23 @@ def _extract_job_id(job: Dict[str, Any]) -> int | None:
         return None
 
 
+def _configure_logging() -> None:
+    """Show debug-level messages from the agent's modules when config.DEBUG is set."""
+    if not config.DEBUG:
+        return
+    logging.basicConfig(format="%(message)s")
+    logging.getLogger("utils_llm_processing_and_extraction").setLevel(logging.DEBUG)
+
+
 def run_agent() -> None:
+    _configure_logging()
     print("=" * 70)
     print("🚀 Starting SparksAI-Agent")
     print(f"   Backend: {config.BASE_URL}")
     print(f"   Job-Types: {', '.join(config.JOB_TYPES)}")
     print(f"   Polling Interval: {config.POLLING_INTERVAL_SECONDS} seconds")
+    if config.DEBUG:
+        print("   Debug logging: enabled")
     print("=" * 70)
 
     client = APIClient()
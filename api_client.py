@@ -1,4 +1,5 @@
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional, Tuple
 
 import requests
@@ -301,9 +302,36 @@ class APIClient:
         )
         return resp.status_code, self._safe_json(resp)
 
-    def list_pi_ai_cards(self) -> Tuple[int, Any]:
+    def list_pi_ai_cards(
+        self,
+        team_name: str | None = None,
+        pi: str | None = None,
+        card_name: str | None = None,
+        date: str | None = None,
+    ) -> Tuple[int, Any]:
+        """List PI AI cards, optionally filtered server-side.
+        
+        Args:
+            team_name: Optional team name to filter by
+            pi: Optional PI name to filter by
+            card_name: Optional card name to filter by
+            date: Optional card date (YYYY-MM-DD) to filter by
+            
+        Returns:
+            Tuple of (status_code, response_data)
+        """
+        params: Dict[str, Any] = {}
+        if team_name:
+            params["team_name"] = team_name
+        if pi:
+            params["pi"] = pi
+        if card_name:
+            params["card_name"] = card_name
+        if date:
+            params["date"] = date
         resp = requests.get(
             self._url("/api/v1/pi-ai-cards"),
+            params=params,
             headers=self._headers(),
             timeout=self.timeout_seconds,
         )
@@ -327,6 +355,16 @@ class APIClient:
         )
         return resp.status_code, self._safe_json(resp)
 
+    def create_recommendations(self, bodies: List[Dict[str, Any]]) -> List[Tuple[int, Any]]:
+        """Create several recommendations, one (status, response) per body in order.
+
+        The API has no bulk endpoint, so the POSTs are issued concurrently.
+        """
+        if len(bodies) <= 1:
+            return [self.create_recommendation(body) for body in bodies]
+        with ThreadPoolExecutor(max_workers=len(bodies)) as executor:
+            return list(executor.map(self.create_recommendation, bodies))
+
     # Team AI cards (for Sprint Goal upsert when implemented)
     def create_team_ai_card(self, body: Dict[str, Any]) -> Tuple[int, Any]:
         resp = requests.post(
@@ -337,9 +375,32 @@ class APIClient:
         )
         return resp.status_code, self._safe_json(resp)
 
-    def list_team_ai_cards(self) -> Tuple[int, Any]:
+    def list_team_ai_cards(
+        self,
+        team_name: str | None = None,
+        card_name: str | None = None,
+        date: str | None = None,
+    ) -> Tuple[int, Any]:
+        """List team AI cards, optionally filtered server-side.
+        
+        Args:
+            team_name: Optional team name to filter by
+            card_name: Optional card name to filter by
+            date: Optional card date (YYYY-MM-DD) to filter by
+            
+        Returns:
+            Tuple of (status_code, response_data)
+        """
+        params: Dict[str, Any] = {}
+        if team_name:
+            params["team_name"] = team_name
+        if card_name:
+            params["card_name"] = card_name
+        if date:
+            params["date"] = date
         resp = requests.get(
             self._url("/api/v1/team-ai-cards"),
+            params=params,
             headers=self._headers(),
             timeout=self.timeout_seconds,
         )
@@ -28,4 +28,7 @@ PROCESS_JOBS_CONTINUOUSLY: bool = True
 # Network backoff when backend is unreachable
 NETWORK_BACKOFF_CAP_SECONDS: int = _int_env("NETWORK_BACKOFF_CAP", 300)
 
+# Verbose per-call debug logging (extraction details etc.); enable with SPARKSAI_DEBUG=1
+DEBUG: bool = os.getenv("SPARKSAI_DEBUG", "").strip().lower() in ("1", "true", "yes")
+
 
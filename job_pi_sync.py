@@ -5,14 +5,16 @@ from datetime import datetime, timezone
 import config
 from api_client import APIClient
 from llm_client import call_agent_llm_process
-from utils_processing import (
-    extract_recommendations,
-    extract_review_section,
-    extract_text_and_json,
+from utils_data_fetching import (
     fetch_pi_data_for_analysis,
-    format_pi_analysis_input,
     get_prompt_with_error_check,
     get_transcripts_for_analysis,
+)
+from utils_formatting import format_pi_analysis_input
+from utils_llm_processing_and_extraction import (
+    extract_recommendations,
+    extract_review_section,
+    extract_text_and_json_raw,
     process_llm_response_and_save_ai_card,
     save_recommendations_from_json,
 )
@@ -116,8 +118,8 @@ def process(job: Dict[str, Any]) -> Tuple[bool, str]:
         extract_content_fn=extract_review_section,
     )
     
-    # Extract recommendations_json from LLM response for recommendations saving
-    _, _, recommendations_json, _ = extract_text_and_json(llm_answer)
+    # Extract parsed recommendations from LLM response for recommendations saving
+    _, _, recommendations, _ = extract_text_and_json_raw(llm_answer)
 
     # Extract and create recommendations
     print("📋 EXTRACTING AND SAVING RECOMMENDATIONS")
@@ -128,7 +130,7 @@ def process(job: Dict[str, Any]) -> Tuple[bool, str]:
     # For recommendations, team_name should actually be the quarter (PI)
     recommendations_saved = save_recommendations_from_json(
         client=client,
-        recommendations_json=recommendations_json,
+        recommendations_json=recommendations,
         team_name_or_pi=pi,  # Use PI name as team_name for recommendations
         today=today,
         full_info_truncated=full_info_truncated,
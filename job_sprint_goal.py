@@ -4,14 +4,16 @@ from datetime import datetime, timezone
 import config
 from api_client import APIClient
 from llm_client import call_agent_llm_process
-from utils_processing import (
-    extract_recommendations,
-    extract_text_and_json,
-    extract_review_section,
+from utils_data_fetching import (
     get_prompt_with_error_check,
-    save_recommendations_from_json,
     get_active_sprint_summary_by_team_for_analysis,
     get_sprint_issues_with_epic_for_analysis,
+)
+from utils_llm_processing_and_extraction import (
+    extract_recommendations,
+    extract_text_and_json_raw,
+    extract_review_section,
+    save_recommendations_from_json,
     process_llm_response_and_save_ai_card,
 )
 
@@ -115,8 +117,8 @@ def process(job: Dict[str, Any]) -> Tuple[bool, str]:
         extract_content_fn=extract_review_section,
     )
     
-    # Extract recommendations_json from LLM response for recommendations saving
-    _, _, recommendations_json, _ = extract_text_and_json(llm_answer)
+    # Extract parsed recommendations from LLM response for recommendations saving
+    _, _, recommendations, _ = extract_text_and_json_raw(llm_answer)
 
     # Extract and create recommendations
     print("📋 EXTRACTING AND SAVING RECOMMENDATIONS")
@@ -126,7 +128,7 @@ def process(job: Dict[str, Any]) -> Tuple[bool, str]:
     # First try to extract recommendations from JSON if available
     recommendations_saved = save_recommendations_from_json(
         client=client,
-        recommendations_json=recommendations_json,
+        recommendations_json=recommendations,
         team_name_or_pi=team_name,
         today=today,
         full_info_truncated=full_info_truncated,
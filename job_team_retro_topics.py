@@ -4,14 +4,16 @@ from datetime import datetime, timezone
 import config
 from api_client import APIClient
 from llm_client import call_agent_llm_process
-from utils_processing import (
-    extract_recommendations,
-    extract_text_and_json,
-    extract_review_section,
+from utils_data_fetching import (
     get_prompt_with_error_check,
     get_team_sprint_burndown_for_analysis,
     get_transcripts_for_analysis,
     get_sprint_predictability_for_analysis,
+)
+from utils_llm_processing_and_extraction import (
+    extract_recommendations,
+    extract_text_and_json_raw,
+    extract_review_section,
     process_llm_response_and_save_ai_card,
     save_recommendations_from_json,
 )
@@ -112,17 +114,17 @@ def process(job: Dict[str, Any]) -> Tuple[bool, str]:
         extract_content_fn=extract_review_section,
     )
     
-    # Extract recommendations_json from LLM response for recommendations saving
-    _, _, recommendations_json, _ = extract_text_and_json(llm_answer)
+    # Extract parsed recommendations from LLM response for recommendations saving
+    _, _, recommendations, _ = extract_text_and_json_raw(llm_answer)
 
     # Extract and create recommendations
     print("📋 EXTRACTING AND SAVING RECOMMENDATIONS")
     
     today = datetime.now(timezone.utc).date().isoformat()
-    if recommendations_json:
+    if recommendations:
         save_recommendations_from_json(
             client=client,
-            recommendations_json=recommendations_json,
+            recommendations_json=recommendations,
             team_name_or_pi=team_name,
             today=today,
             full_info_truncated=full_info_truncated,
@@ -1,45 +1,121 @@
-from typing import Any, Dict, List
+import re
+from functools import lru_cache
+from io import StringIO
+from typing import Any, Callable, Dict, Iterator, List, Tuple
 
 from api_client import APIClient
 
 
+# Plain integer/decimal strings such as "42", "-3" or "12.5"
+_NUMERIC_STR_RE = re.compile(r'-?\d+(?:\.\d+)?')
+
+# Case-insensitive column-name checks that avoid building a lowercased copy per column
+_POINT_RE = re.compile(r'point', re.IGNORECASE)
+_REMAINING_ISSUES_RE = re.compile(r'remaining_issues', re.IGNORECASE)
+
+# format_transcript placeholders
+_NO_TRANSCRIPT = "No transcript found"
+_NO_TRANSCRIPT_TEXT = "No transcript text found"
+
+
 def filter_columns_excluding_points(columns: List[str]) -> List[str]:
-    return [c for c in columns if 'point' not in c.lower()]
+    # Fast path: most schemas have no point columns, so hand back the input list as-is
+    for c in columns:
+        if _POINT_RE.search(c):
+            break
+    else:
+        return columns
+    return [c for c in columns if not _POINT_RE.search(c)]
 
 
-def format_table(records: List[Dict[str, Any]], max_width: int = 20) -> str:
+@lru_cache(maxsize=128)
+def _table_columns(columns: Tuple[str, ...]) -> Tuple[Tuple[str, ...], str | None]:
+    """Drop point columns and find the first remaining_issues column in a single pass.
+    
+    Cached per key tuple, since tables built from the same endpoint share one schema.
+    """
+    kept = []
+    remaining_key = None
+    for c in columns:
+        if _POINT_RE.search(c):
+            continue
+        kept.append(c)
+        if remaining_key is None and _REMAINING_ISSUES_RE.search(c):
+            remaining_key = c
+    return tuple(kept), remaining_key
+
+
+def _is_blank_value(val: Any) -> bool:
+    """True for None or values that read as '' / 'null' (rows format_table skips)."""
+    if val is None:
+        return True
+    # Numbers never render as ''/'null', so only strings and unknown types need str()
+    if isinstance(val, str):
+        return val.strip().lower() in ('', 'null')
+    if isinstance(val, (int, float)):
+        return False
+    return str(val).strip().lower() in ('', 'null')
+
+
+@lru_cache(maxsize=64)
+def _row_formatter(columns: Tuple[str, ...], max_width: int) -> Callable[[Dict[str, Any]], str]:
+    """Build a row formatter specialized for one column schema and width.
+    
+    Jobs format many rows with the same handful of columns, so the per-cell loop is
+    unrolled into straight-line code with the column names inlined as literals (via
+    repr, so any key is safe). Missing or None values render as NULL.
+    """
+    null_pad = repr('NULL'.ljust(max_width))
+    src = ["def _format_row(rec):", "    get = rec.get"]
+    cells = []
+    for i, col in enumerate(columns):
+        src.append(f"    v{i} = get({col!r})")
+        cells.append(f"{null_pad} if v{i} is None else str(v{i})[:{max_width}].ljust({max_width})")
+    src.append("    return ' | '.join((" + ", ".join(f"({cell})" for cell in cells) + ",))")
+    namespace: Dict[str, Any] = {}
+    exec("\n".join(src), namespace)
+    return namespace["_format_row"]
+
+
+def _iter_table_lines(records: List[Dict[str, Any]], max_width: int = 20) -> Iterator[str]:
+    """Yield the header, separator and row lines of format_table one at a time.
+    
+    Yields nothing when there are no records or no displayable columns, so callers that
+    splice the table into a larger document never hold a separately joined table string.
+    """
     if not records:
-        return ""
+        return
     # Build column set from first record
-    columns = list(records[0].keys())
-    columns = filter_columns_excluding_points(columns)
+    columns, remaining_key = _table_columns(tuple(records[0].keys()))
     if not columns:
-        return ""
+        return
 
     # Header
-    header = " | ".join([f"{col[:max_width]:<{max_width}}" for col in columns])
-    sep = "-" * len(header)
-    lines = [header, sep]
+    header = " | ".join([col[:max_width].ljust(max_width) for col in columns])
+    yield header
+    yield "-" * len(header)
 
     # Rows (skip rows where remaining_issues is null/empty if present)
-    remaining_key = None
-    for c in columns:
-        if 'remaining_issues' in c.lower():
-            remaining_key = c
-            break
+    if len(records) == 1:
+        # Single summary rows are common; format inline rather than generating a formatter
+        rec = records[0]
+        if remaining_key is None or not _is_blank_value(rec.get(remaining_key)):
+            null_pad = 'NULL'.ljust(max_width)
+            yield " | ".join([
+                null_pad if (v := rec.get(col)) is None else str(v)[:max_width].ljust(max_width)
+                for col in columns
+            ])
+        return
 
+    format_row = _row_formatter(columns, int(max_width))
     for rec in records:
-        if remaining_key is not None:
-            val = rec.get(remaining_key)
-            if val is None or str(val).strip().lower() in ('', 'null'):
-                continue
-        row_values = []
-        for col in columns:
-            v = rec.get(col)
-            row_values.append(f"{str(v)[:max_width] if v is not None else 'NULL':<{max_width}}")
-        lines.append(" | ".join(row_values))
+        if remaining_key is not None and _is_blank_value(rec.get(remaining_key)):
+            continue
+        yield format_row(rec)
 
-    return "\n".join(lines)
+
+def format_table(records: List[Dict[str, Any]], max_width: int = 20) -> str:
+    return "\n".join(_iter_table_lines(records, max_width))
 
 
 def format_transcript(transcript: Dict[str, Any] | None, include_label: str = "Transcript:") -> str:
@@ -53,16 +129,19 @@ def format_transcript(transcript: Dict[str, Any] | None, include_label: str = "T
         Formatted markdown string with transcript information
     """
     if not transcript or not isinstance(transcript, dict):
-        return "No transcript found"
+        return _NO_TRANSCRIPT
     
     parts = []
-    # Add metadata fields if available
-    if transcript.get("type"):
-        parts.append(f"Type: {transcript.get('type')}")
-    if transcript.get("team_name"):
-        parts.append(f"Team/PI: {transcript.get('team_name')}")
-    if transcript.get("file_name"):
-        parts.append(f"File: {transcript.get('file_name')}")
+    # Add metadata fields if available (one lookup per field)
+    transcript_type = transcript.get("type")
+    if transcript_type:
+        parts.append(f"Type: {transcript_type}")
+    team_name = transcript.get("team_name")
+    if team_name:
+        parts.append(f"Team/PI: {team_name}")
+    file_name = transcript.get("file_name")
+    if file_name:
+        parts.append(f"File: {file_name}")
     
     # Add the full raw text
     raw = transcript.get("raw_text")
@@ -70,11 +149,25 @@ def format_transcript(transcript: Dict[str, Any] | None, include_label: str = "T
         parts.append(include_label)
         parts.append(str(raw))
     else:
-        parts.append("No transcript text found")
+        parts.append(_NO_TRANSCRIPT_TEXT)
     
     return "\n".join(parts)
 
 
+def _list_preview(values: List[Any], limit: int) -> str:
+    """Return str(values) cut to limit chars plus "..." when longer, without rendering the whole list."""
+    parts = ["["]
+    length = 1
+    for i, item in enumerate(values):
+        piece = repr(item) if i == 0 else ", " + repr(item)
+        parts.append(piece)
+        length += len(piece)
+        if length > limit:
+            return "".join(parts)[:limit] + "..."
+    text = "".join(parts) + "]"
+    return text if len(text) <= limit else text[:limit] + "..."
+
+
 def format_burndown_markdown(burndown: Dict[str, Any] | List[Dict[str, Any]] | None) -> str:
     """Format burndown data as structured markdown for LLM and UI display.
     
@@ -93,7 +186,6 @@ def format_burndown_markdown(burndown: Dict[str, Any] | List[Dict[str, Any]] | N
     if not burndown or not isinstance(burndown, dict):
         return "No burndown data found"
     
-    lines = []
     # Group related fields for better readability
     numeric_fields = []
     date_fields = []
@@ -101,65 +193,75 @@ def format_burndown_markdown(burndown: Dict[str, Any] | List[Dict[str, Any]] | N
     other_fields = []
     
     for k, v in burndown.items():
-        k_lower = str(k).lower()
-        
         # Check if it's a list (especially burndown_data)
         if isinstance(v, list):
             list_fields.append((k, v))
-        elif any(x in k_lower for x in ['date', 'time', 'day']):
+            continue
+        
+        # Key names decide the date group before value types are looked at, so
+        # e.g. "days_remaining": 5 stays under Dates; only lowercase when needed
+        k_lower = k.lower() if isinstance(k, str) else str(k).lower()
+        if 'date' in k_lower or 'time' in k_lower or 'day' in k_lower:
             date_fields.append((k, v))
-        elif isinstance(v, (int, float)) or (isinstance(v, str) and v.replace('.', '').replace('-', '').isdigit()):
+        elif isinstance(v, (int, float)) or (isinstance(v, str) and _NUMERIC_STR_RE.fullmatch(v)):
             numeric_fields.append((k, v))
         else:
             other_fields.append((k, v))
     
+    # Every line is written to one buffer followed by "\n"; the final newline is dropped on return
+    out = StringIO()
+    
+    def emit(line: str) -> None:
+        out.write(line)
+        out.write("\n")
+    
     # Handle lists - especially burndown_data or any list of dicts
     if list_fields:
         for k, v_list in list_fields:
             if isinstance(v_list, list) and len(v_list) > 0 and isinstance(v_list[0], dict):
                 # Format as table using existing utility
-                lines.append(f"**{k}:**")
-                table = format_table(v_list)
-                if table:
-                    lines.append(table)
-                else:
+                emit(f"**{k}:**")
+                # Stream table lines straight into the buffer
+                table_start = out.tell()
+                for line in _iter_table_lines(v_list):
+                    emit(line)
+                if out.tell() == table_start:
                     # Fallback: show count and sample
-                    lines.append(f"- Total records: {len(v_list)}")
+                    emit(f"- Total records: {len(v_list)}")
                     if len(v_list) > 0:
-                        lines.append(f"- Sample record fields: {', '.join(list(v_list[0].keys())[:5])}...")
-                lines.append("")
+                        emit(f"- Sample record fields: {', '.join(list(v_list[0].keys())[:5])}...")
+                emit("")
             else:
                 # Other lists - show count and truncated preview
-                lines.append(f"**{k}:**")
-                lines.append(f"- Count: {len(v_list)}")
-                preview = str(v_list)[:200]
-                if len(str(v_list)) > 200:
-                    preview += "..."
-                lines.append(f"- Preview: `{preview}`")
-                lines.append("")
+                emit(f"**{k}:**")
+                emit(f"- Count: {len(v_list)}")
+                preview = _list_preview(v_list, 200)
+                emit(f"- Preview: `{preview}`")
+                emit("")
     
     if date_fields:
-        lines.append("**Dates & Timeline:**")
+        emit("**Dates & Timeline:**")
         for k, v in date_fields:
-            lines.append(f"- {k}: `{v}`")
-        lines.append("")
+            emit(f"- {k}: `{v}`")
+        emit("")
     
     if numeric_fields:
-        lines.append("**Metrics & Numbers:**")
+        emit("**Metrics & Numbers:**")
         for k, v in numeric_fields:
-            lines.append(f"- {k}: `{v}`")
-        lines.append("")
+            emit(f"- {k}: `{v}`")
+        emit("")
     
     if other_fields:
-        lines.append("**Other Information:**")
+        emit("**Other Information:**")
         for k, v in other_fields:
             # Truncate very long values
             v_str = str(v)
             if len(v_str) > 200:
                 v_str = v_str[:200] + "..."
-            lines.append(f"- {k}: {v_str}")
+            emit(f"- {k}: {v_str}")
     
-    return "\n".join(lines) if lines else "No burndown data found"
+    text = out.getvalue()
+    return text[:-1] if text else "No burndown data found"
 
 
 def format_pi_status(pi_status: Dict[str, Any] | List[Dict[str, Any]] | None) -> str:
@@ -190,16 +292,17 @@ def format_pi_status(pi_status: Dict[str, Any] | List[Dict[str, Any]] | None) ->
         return "No PI status data available for current date."
     
     # Format: "This is the status of the PI as of TODAY" followed by column = value
-    lines = ["This is the status of the PI as of TODAY"]
+    out = StringIO()
+    out.write("This is the status of the PI as of TODAY")
     
     # Get the first item (should only be one for a specific PI)
     status_obj = status_list[0]
     if isinstance(status_obj, dict):
         # Format each column as "column_name = value"
         for key, value in sorted(status_obj.items()):
-            lines.append(f"{key} = {value}")
+            out.write(f"\n{key} = {value}")
     
-    return "\n".join(lines)
+    return out.getvalue()
 
 
 class PROMPT_FORMAT_CONSTANTS:
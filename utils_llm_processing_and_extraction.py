@@ -1,51 +1,192 @@
 import json
-from typing import Any, Callable, Dict, List, Tuple
+import logging
+import re
+import time
+from functools import lru_cache
+from itertools import islice
+from typing import Any, Callable, Dict, Iterator, List, Tuple
 
 from api_client import APIClient
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib json module
+    orjson = None
+
+
+if orjson is not None:
+    # orjson is stricter than the stdlib json module that also decodes responses here
+    # (raw_decode): it rejects NaN/Infinity and integers beyond 64 bits, so such
+    # values fall back to the stdlib instead of failing.
+    def _loads(text: str) -> Any:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            return json.loads(text)
+
+    def _dumps(obj: Any) -> str:
+        try:
+            return orjson.dumps(obj).decode()
+        except TypeError:  # orjson.JSONEncodeError subclasses TypeError
+            return json.dumps(obj)
+else:
+    _loads = json.loads
+    _dumps = json.dumps
+
+
+logger = logging.getLogger(__name__)
+
+# A line whose first non-blank text is a number ("1.") or bullets ("*", "-", "•", "◦")
+# starts a new recommendation. Line boundaries are those of str.splitlines().
+# _ITEM_PREFIX_RE matches such a prefix (with its indentation) at the start of the
+# text; _ITEM_START_RE finds later ones together with the preceding line break,
+# which lets the regex engine jump between line breaks instead of testing every
+# position. The item text runs up to the next match. Indentation is horizontal
+# whitespace only: if it could span line breaks, every break in a run of blank
+# lines would rescan the rest of the run and long runs would take quadratic time.
+_LINE_BREAKS = r'\n\r\x0b\x0c\x1c-\x1e\x85\u2028\u2029'
+_ITEM_PREFIX = r'[^\S' + _LINE_BREAKS + r']*(?:\d+\.[^\S' + _LINE_BREAKS + r']*[*\-•◦]*|[*\-•◦]+)'
+_ITEM_PREFIX_RE = re.compile(_ITEM_PREFIX)
+_ITEM_START_RE = re.compile(r'[' + _LINE_BREAKS + r']' + _ITEM_PREFIX)
+
+# Runs of whitespace collapsed to a single space in recommendation text
+_WS_RE = re.compile(r'\s+')
+_LEADING_NUM_RE = re.compile(r'^\d+\.?\s*')
+
+# Shared decoder for incremental (raw_decode) JSON parsing
+_DECODER = json.JSONDecoder()
+_JSON_WS_RE = re.compile(r'[ \t\n\r]*')
+_NON_WHITESPACE_RE = re.compile(r'\S')
+
+# Key spellings the LLM uses for the dashboard summary section, most common first
+_DASHBOARD_SUMMARY_KEY_ORDER = ('Dashboard_Summary', 'Dashboard Summary', 'DashboardSummary')
+_DASHBOARD_SUMMARY_KEYS = frozenset(_DASHBOARD_SUMMARY_KEY_ORDER)
+
+# The extractors are pure functions of the LLM response and each job runs them more
+# than once on the same answer; responses shorter than this are memoized
+_MAX_CACHED_RESPONSE_LEN = 64_000
+
+
+def _iter_json_array_items(json_text: str) -> Iterator[Tuple[Any, str]]:
+    """Yield (item, item_json) for each element of a JSON array string.
+    
+    Elements are decoded one at a time, so callers can stop early without parsing
+    the rest of the array. item_json is the element's original JSON text.
+    Yields nothing if the text is not a JSON array; raises json.JSONDecodeError
+    on malformed input.
+    """
+    pos = _JSON_WS_RE.match(json_text).end()
+    if not json_text.startswith('[', pos):
+        return
+    pos = _JSON_WS_RE.match(json_text, pos + 1).end()
+    if json_text.startswith(']', pos):
+        return
+    while True:
+        item, end = _DECODER.raw_decode(json_text, pos)
+        yield item, json_text[pos:end]
+        pos = _JSON_WS_RE.match(json_text, end).end()
+        if json_text.startswith(',', pos):
+            pos = _JSON_WS_RE.match(json_text, pos + 1).end()
+        elif json_text.startswith(']', pos):
+            return
+        else:
+            raise json.JSONDecodeError("Expecting ',' delimiter", json_text, pos)
+
 
 def clean_recommendation_text(text: str) -> str:
-    import re
-    s = re.sub(r'^\d+\.?\s*', '', text.strip())
-    s = s.lstrip('*-•◦').strip()
-    return ' '.join(s.split())
+    # ^ is anchored, so one substitution is all that can ever apply. Trailing whitespace
+    # is left for the final strip(), which saves a copy of the input up front.
+    s = _LEADING_NUM_RE.sub('', text.lstrip(), count=1).lstrip('*-•◦')
+    return _WS_RE.sub(' ', s).strip()
 
 
 def extract_recommendations(llm_text: str, max_count: int = 2) -> List[str]:
     if not llm_text:
         return []
-    lines = [ln.strip() for ln in llm_text.split('\n') if ln.strip()]
-    items: List[str] = []
-    current = ""
-    for ln in lines:
-        starts = ln.startswith(tuple([f"{i}." for i in range(1, 10)])) or ln.startswith(('*', '-', '•', '◦'))
-        if starts:
-            if current.strip():
-                items.append(current.strip())
-            current = ln
-        else:
-            if current:
-                current += " " + ln
+    # Insertion-ordered dict as an ordered set: dedupes and keeps first-seen order
+    cleaned: Dict[str, None] = {}
+
+    def _add(item_text: str) -> bool:
+        """Normalize and dedupe a finished item; True once max_count items are collected."""
+        # Numbers/bullets are outside the item slice; line breaks and indentation
+        # collapse into single spaces here
+        c = _WS_RE.sub(' ', item_text).strip()
+        if c:
+            cleaned[c] = None
+        return len(cleaned) >= max_count
+
+    # One regex pass finds item starts lazily, so long responses stop being scanned
+    # once enough items are kept. Text before the first start is an item of its own.
+    pos = 0
+    item_open = False
+    m = _ITEM_PREFIX_RE.match(llm_text)
+    if m:
+        # The response opens with an item
+        item_open = True
+        pos = m.end()
+    for m in _ITEM_START_RE.finditer(llm_text, pos):
+        start = m.start()
+        if (item_open or _NON_WHITESPACE_RE.search(llm_text, pos, start)) and _add(llm_text[pos:start]):
+            return list(cleaned)
+        item_open = True
+        pos = m.end()
+    if item_open or _NON_WHITESPACE_RE.search(llm_text, pos):
+        _add(llm_text[pos:])
+    return list(cleaned)
+
+
+def _iter_recommendation_payloads(
+    recommendations_json: str | List[Any],
+    team_name_or_pi: str,
+    today: str,
+    full_info_truncated: str,
+    job_id: int | None,
+    source_ai_summary_id: int | None,
+) -> Iterator[Tuple[Dict[str, Any], Dict[str, Any]]]:
+    """Yield (recommendation_obj, rec_payload) for each valid recommendation in the JSON array.
+    
+    Accepts the array as JSON text (decoded lazily) or as an already parsed list.
+    """
+    if isinstance(recommendations_json, str):
+        items = _iter_json_array_items(recommendations_json)
+    elif isinstance(recommendations_json, list):
+        # Pre-parsed: each element is serialized on its own only if it gets saved
+        items = ((recommendation_obj, None) for recommendation_obj in recommendations_json)
+    else:
+        items = iter(())
+    try:
+        for recommendation_obj, recommendation_json in items:
+            if isinstance(recommendation_obj, dict) and 'header' in recommendation_obj and 'text' in recommendation_obj:
+                if recommendation_json is None:
+                    recommendation_json = _dumps(recommendation_obj)
+                # Get priority from JSON if available, otherwise default to "Important"
+                priority = recommendation_obj.get('priority', 'Important')
+                
+                rec_payload = {
+                    "team_name": team_name_or_pi,
+                    "action_text": recommendation_obj['text'],
+                    "rational": recommendation_obj['header'],  # Use header as rational
+                    "date": today,
+                    "priority": priority,
+                    "status": "Proposed",
+                    "full_information": full_info_truncated,
+                    "information_json": recommendation_json,  # Store individual recommendation JSON
+                    "source_job_id": job_id,
+                    "source_ai_summary_id": source_ai_summary_id,
+                }
+                # Debug: Log the payload being sent
+                if source_ai_summary_id is None:
+                    print(f"⚠️ WARNING: source_ai_summary_id is None when creating recommendation")
+                yield recommendation_obj, rec_payload
             else:
-                current = ln
-    if current.strip():
-        items.append(current.strip())
-
-    cleaned = []
-    seen = set()
-    for it in items:
-        c = clean_recommendation_text(it)
-        if c and c not in seen:
-            cleaned.append(c)
-            seen.add(c)
-        if len(cleaned) >= max_count:
-            break
-    return cleaned
+                print(f"⚠️ Skipping invalid recommendation object: {recommendation_obj}")
+    except json.JSONDecodeError as e:
+        print(f"❌ Failed to parse recommendations JSON: {e}")
 
 
 def save_recommendations_from_json(
     client: APIClient,
-    recommendations_json: str,
+    recommendations_json: str | List[Any],
     team_name_or_pi: str,
     today: str,
     full_info_truncated: str,
@@ -58,7 +199,8 @@ def save_recommendations_from_json(
     
     Args:
         client: APIClient instance for API calls
-        recommendations_json: JSON string containing recommendations array
+        recommendations_json: JSON string containing recommendations array, or the
+            already parsed list (skips re-parsing; other types save nothing)
         team_name_or_pi: Team name (for Daily/Sprint) or PI name (for PI Sync)
         today: Date string in ISO format
         full_info_truncated: Truncated full information text
@@ -73,46 +215,32 @@ def save_recommendations_from_json(
         return 0
     
     recommendations_saved = 0
-    try:
-        parsed_recommendations = json.loads(recommendations_json)
-        if isinstance(parsed_recommendations, list) and parsed_recommendations:
-            print(f"📋 Saving {len(parsed_recommendations)} recommendations from JSON to database...")
-            
-            # Save each recommendation using the JSON structure
-            for recommendation_obj in parsed_recommendations:
-                if isinstance(recommendation_obj, dict) and 'header' in recommendation_obj and 'text' in recommendation_obj:
-                    # Get priority from JSON if available, otherwise default to "Important"
-                    priority = recommendation_obj.get('priority', 'Important')
-                    
-                    rec_payload = {
-                        "team_name": team_name_or_pi,
-                        "action_text": recommendation_obj['text'],
-                        "rational": recommendation_obj['header'],  # Use header as rational
-                        "date": today,
-                        "priority": priority,
-                        "status": "Proposed",
-                        "full_information": full_info_truncated,
-                        "information_json": json.dumps(recommendation_obj),  # Store individual recommendation JSON
-                        "source_job_id": job_id,
-                        "source_ai_summary_id": source_ai_summary_id,
-                    }
-                    # Debug: Log the payload being sent
-                    if source_ai_summary_id is None:
-                        print(f"⚠️ WARNING: source_ai_summary_id is None when creating recommendation")
-                    rsc, rresp = client.create_recommendation(rec_payload)
-                    if rsc >= 300:
-                        print(f"⚠️ Create recommendation failed: {rsc} {rresp}")
-                    else:
-                        recommendations_saved += 1
-                        print(f"🧩 Recommendation: priority='{priority}' status='Proposed' header='{recommendation_obj['header'][:60]}' text='{recommendation_obj['text'][:120]}'")
-                    
-                    # Limit to max recommendations
-                    if recommendations_saved >= max_count:
-                        break
-                else:
-                    print(f"⚠️ Skipping invalid recommendation object: {recommendation_obj}")
-    except json.JSONDecodeError as e:
-        print(f"❌ Failed to parse recommendations JSON: {e}")
+    logger.debug("📋 Saving recommendations from JSON to database...")
+    pending = _iter_recommendation_payloads(
+        recommendations_json,
+        team_name_or_pi,
+        today,
+        full_info_truncated,
+        job_id,
+        source_ai_summary_id,
+    )
+    
+    # POST up to the remaining quota in one batch; if some fail, the next batch
+    # tries the following recommendations until max_count are saved
+    while recommendations_saved < max_count:
+        batch = list(islice(pending, max_count - recommendations_saved))
+        if not batch:
+            break
+        results = client.create_recommendations([rec_payload for _, rec_payload in batch])
+        for (recommendation_obj, rec_payload), (rsc, rresp) in zip(batch, results):
+            if rsc >= 300:
+                print(f"⚠️ Create recommendation failed: {rsc} {rresp}")
+            else:
+                recommendations_saved += 1
+                logger.debug(
+                    "🧩 Recommendation: priority='%s' status='Proposed' header='%.60s' text='%.120s'",
+                    rec_payload['priority'], recommendation_obj['header'], recommendation_obj['text'],
+                )
     
     return recommendations_saved
 
@@ -126,6 +254,12 @@ class LLM_EXTRACTION_CONSTANTS:
     MAX_RECOMMENDATIONS = 2  # Maximum number of recommendations to extract
 
 
+@lru_cache(maxsize=32)
+def _marker_pattern(marker: str) -> re.Pattern[str]:
+    """Compiled case-insensitive pattern for a literal section marker."""
+    return re.compile(re.escape(marker), re.IGNORECASE)
+
+
 def extract_content_between_markers(
     llm_response: str, 
     start_marker: str, 
@@ -141,54 +275,41 @@ def extract_content_between_markers(
     
     Returns:
         str: Extracted content between markers, or None if start marker not found,
-             empty string if end marker not found
+             empty string if end marker not found after the start marker
     """
     try:
-        # Split response into lines for better processing
-        lines = llm_response.split('\n')
+        # Search the response as a whole with case-insensitive marker patterns and
+        # slice the original text at line boundaries (no per-line split)
         
         # Look for start marker line (case-insensitive)
-        start_line = -1
-        for i, line in enumerate(lines):
-            if start_marker.lower() in line.lower():
-                start_line = i
-                break
-        
-        if start_line == -1:
+        start_match = _marker_pattern(start_marker).search(llm_response)
+        if start_match is None:
             print(f"⚠️ '{start_marker}' section not found in LLM response")
             return None
         
-        # Look for end marker line (case-insensitive)
-        end_line = -1
-        for i, line in enumerate(lines):
-            if end_marker.lower() in line.lower():
-                end_line = i
-                break
+        # Content starts on the line AFTER the start marker
+        start_line_end = llm_response.find('\n', start_match.end())
+        content_start = start_line_end + 1 if start_line_end != -1 else len(llm_response)
         
-        if end_line == -1:
+        # Look for end marker line (case-insensitive) after the start marker line only,
+        # so the response is scanned in a single forward pass
+        end_match = _marker_pattern(end_marker).search(llm_response, content_start)
+        if end_match is None:
             print(f"⚠️ '{end_marker}' section not found in LLM response")
             return ""
         
-        # Start extracting AFTER start marker
-        content_start_line = start_line + 1
-        
-        # Skip empty lines after start marker until content starts
-        while content_start_line < len(lines) and lines[content_start_line].strip() == "":
-            content_start_line += 1
-        
-        if content_start_line >= len(lines):
-            print(f"⚠️ No content found after '{start_marker}'")
-            return ""
-        
-        # Extract content between start and end markers
-        content_lines = lines[content_start_line:end_line]
-        content_text = '\n'.join(content_lines).strip()
+        # Content stops before the line holding the end marker
+        content_end = llm_response.rfind('\n', 0, end_match.start()) + 1
+        content_text = llm_response[content_start:content_end].strip()
         
         if not content_text:
-            print(f"⚠️ No content found between '{start_marker}' and '{end_marker}'")
+            if _NON_WHITESPACE_RE.search(llm_response, content_start) is None:
+                print(f"⚠️ No content found after '{start_marker}'")
+            else:
+                print(f"⚠️ No content found between '{start_marker}' and '{end_marker}'")
             return ""
         
-        print(f"✅ Extracted content between '{start_marker}' and '{end_marker}' ({len(content_text)} characters)")
+        logger.debug("✅ Extracted content between '%s' and '%s' (%d characters)", start_marker, end_marker, len(content_text))
         return content_text
         
     except Exception as e:
@@ -196,15 +317,15 @@ def extract_content_between_markers(
         return ""
 
 
-def extract_json_sections(parsed_json: Dict[str, Any] | List[Any]) -> Tuple[str, str]:
+def extract_json_sections_raw(parsed_json: Dict[str, Any] | List[Any]) -> Tuple[Any, Any]:
     """
-    Extract DashboardSummary and Recommendations from parsed JSON
+    Extract DashboardSummary and Recommendations from parsed JSON as Python objects
     
     Args:
         parsed_json: Parsed JSON object
     
     Returns:
-        tuple: (dashboard_summary_json, recommendations_json) as JSON strings
+        tuple: (dashboard_summary, recommendations) as parsed values; [] when a section is missing
     """
     try:
         # Handle both dict and list inputs
@@ -214,131 +335,209 @@ def extract_json_sections(parsed_json: Dict[str, Any] | List[Any]) -> Tuple[str,
             recommendations = []
             for item in parsed_json:
                 if isinstance(item, dict):
-                    if 'Dashboard_Summary' in item or 'Dashboard Summary' in item or 'DashboardSummary' in item:
+                    if not _DASHBOARD_SUMMARY_KEYS.isdisjoint(item):
                         dashboard_summary.append(item)
                     if 'Recommendations' in item:
                         recommendations.append(item.get('Recommendations', []))
-            dashboard_summary_json = json.dumps(dashboard_summary) if dashboard_summary else ""
-            recommendations_json = json.dumps(recommendations[0] if recommendations else []) if recommendations else ""
-            return dashboard_summary_json, recommendations_json
+            return dashboard_summary, recommendations[0] if recommendations else []
         
         # Handle dict input
         if not isinstance(parsed_json, dict):
             print(f"⚠️ Unexpected JSON type: {type(parsed_json)}")
-            return "", ""
+            return [], []
         
-        # Debug: Print all available keys
-        available_keys = list(parsed_json.keys())
-        print(f"🔍 DEBUG: Available JSON keys: {available_keys}")
+        # Debug: Log all available keys
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("🔍 Available JSON keys: %s", list(parsed_json))
         
-        # Extract DashboardSummary (try multiple variations in order of likelihood)
+        # Extract DashboardSummary (first key variation present, in order of likelihood)
         dashboard_summary = []
-        
-        # Try Dashboard_Summary first (most common in your output)
-        if 'Dashboard_Summary' in parsed_json:
-            dashboard_summary = parsed_json['Dashboard_Summary']
-            print(f"✅ Found Dashboard_Summary with {len(dashboard_summary) if isinstance(dashboard_summary, list) else 'unknown'} items")
-        elif 'Dashboard Summary' in parsed_json:
-            dashboard_summary = parsed_json['Dashboard Summary']
-            print(f"✅ Found 'Dashboard Summary' with {len(dashboard_summary) if isinstance(dashboard_summary, list) else 'unknown'} items")
-        elif 'DashboardSummary' in parsed_json:
-            dashboard_summary = parsed_json['DashboardSummary']
-            print(f"✅ Found DashboardSummary with {len(dashboard_summary) if isinstance(dashboard_summary, list) else 'unknown'} items")
+        summary_key = next((k for k in _DASHBOARD_SUMMARY_KEY_ORDER if k in parsed_json), None)
+        if summary_key is not None:
+            dashboard_summary = parsed_json[summary_key]
+            logger.debug("✅ Found '%s' with %s items", summary_key, len(dashboard_summary) if isinstance(dashboard_summary, list) else 'unknown')
         else:
-            print(f"⚠️ No Dashboard Summary key found. Available keys: {available_keys}")
-        
-        dashboard_summary_json = json.dumps(dashboard_summary) if dashboard_summary else ""
+            print(f"⚠️ No Dashboard Summary key found. Available keys: {list(parsed_json)}")
         
         # Extract Recommendations
         recommendations = parsed_json.get('Recommendations', [])
-        recommendations_json = json.dumps(recommendations) if recommendations else ""
         
-        print(f"✅ Extracted sections: DashboardSummary={len(dashboard_summary) if isinstance(dashboard_summary, list) else 0} items, Recommendations={len(recommendations) if isinstance(recommendations, list) else 0} items")
-        return dashboard_summary_json, recommendations_json
+        logger.debug(
+            "✅ Extracted sections: DashboardSummary=%d items, Recommendations=%d items",
+            len(dashboard_summary) if isinstance(dashboard_summary, list) else 0,
+            len(recommendations) if isinstance(recommendations, list) else 0,
+        )
+        return dashboard_summary, recommendations
         
     except Exception as e:
         print(f"❌ Error extracting JSON sections: {e}")
-        return "", ""
+        return [], []
 
 
-def extract_text_and_json(llm_response: str) -> Tuple[str, str, str, str]:
+def extract_json_sections(parsed_json: Dict[str, Any] | List[Any]) -> Tuple[str, str]:
     """
-    Extract and separate text from JSON in the LLM response.
-    Parses JSON to extract DashboardSummary and Recommendations separately.
+    Extract DashboardSummary and Recommendations from parsed JSON
+    
+    Args:
+        parsed_json: Parsed JSON object
     
     Returns:
-        tuple: (text_part, dashboard_summary_json, recommendations_json, raw_json_string) where:
-            text_part: Text content BEFORE JSON starts (for full_information)
-            dashboard_summary_json: JSON array of DashboardSummary (for summary cards)
-            recommendations_json: JSON array of Recommendations (for recommendations table)
-            raw_json_string: Raw JSON string as extracted (for information_json storage)
+        tuple: (dashboard_summary_json, recommendations_json) as JSON strings ("" when empty)
+    """
+    dashboard_summary, recommendations = extract_json_sections_raw(parsed_json)
+    try:
+        return _dumps_section(dashboard_summary), _dumps_section(recommendations)
+    except Exception as e:
+        print(f"❌ Error extracting JSON sections: {e}")
+        return "", ""
+
+
+def _dumps_section(section: Any) -> str:
+    """Serialize a JSON section for storage; empty sections become ""."""
+    return _dumps(section) if section else ""
+
+
+def _split_text_and_json(trimmed: str, split_pos: int, json_content: str) -> Tuple[str, Any, Any, str]:
     """
+    Parse a JSON candidate once and build the extract_text_and_json_raw result.
+    
+    The parsed object goes straight to extract_json_sections_raw, and json_content (already
+    a slice of the response) is returned as-is as raw_json_string. The text before
+    split_pos is only built once parsing succeeds. Raises if json_content is not valid JSON.
+    """
+    return _text_and_json_result(trimmed, split_pos, _loads(json_content), json_content)
+
+
+def _text_and_json_result(trimmed: str, split_pos: int, parsed_json: Any, json_content: str) -> Tuple[str, Any, Any, str]:
+    """Build the extract_text_and_json_raw result from an already parsed JSON value."""
+    dashboard_summary, recommendations = extract_json_sections_raw(parsed_json)
+    return trimmed[:split_pos].strip(), dashboard_summary, recommendations, json_content
+
+
+def _extract_text_and_json(llm_response: str) -> Tuple[str, Any, Any, str]:
+    """Uncached implementation of extract_text_and_json_raw."""
     try:
         trimmed = llm_response.strip()
         
+        # Fast path: without a bracket or BEGIN_JSON marker there is no JSON to look for
+        if '{' not in trimmed and '[' not in trimmed and 'BEGIN_JSON' not in trimmed:
+            logger.debug("ℹ️ No JSON found in LLM response")
+            return trimmed, [], [], ""
+        
         # First try to find BEGIN_JSON/END_JSON markers
         begin_pos = trimmed.find('BEGIN_JSON')
         if begin_pos != -1:
             end_pos = trimmed.find('END_JSON')
             if end_pos != -1:
                 json_content = trimmed[begin_pos + len('BEGIN_JSON'):end_pos].strip()
-                text_before = trimmed[:begin_pos].strip()
                 try:
-                    parsed_json = json.loads(json_content)  # Validate JSON
-                    dashboard_summary, recommendations = extract_json_sections(parsed_json)
-                    print(f"✅ JSON found with BEGIN_JSON/END_JSON markers, split at {begin_pos}: text={len(text_before)} chars")
-                    return text_before, dashboard_summary, recommendations, json_content
+                    result = _split_text_and_json(trimmed, begin_pos, json_content)
+                    logger.debug("✅ JSON found with BEGIN_JSON/END_JSON markers, split at %d: text=%d chars", begin_pos, len(result[0]))
+                    return result
                 except Exception as e:
                     print(f"⚠️ Failed to parse JSON between BEGIN_JSON/END_JSON: {e}")
         
         # Look for JSON markers: ```json or ``` or just start of JSON { or [
         # First try to find markdown code fences
+        json_fence_pos = -1
         for marker in ['```json', '```']:
             start_pos = trimmed.find(marker)
-            if start_pos != -1:
+            # A ```json fence that failed to parse would fail again as "json ..." under ```
+            if start_pos != -1 and start_pos != json_fence_pos:
+                if marker == '```json':
+                    json_fence_pos = start_pos
                 # Find closing ```
                 end_pos = trimmed.find('```', start_pos + len(marker))
                 if end_pos != -1:
                     json_content = trimmed[start_pos + len(marker):end_pos].strip()
-                    text_before = trimmed[:start_pos].strip()
                     try:
-                        parsed_json = json.loads(json_content)  # Validate JSON
-                        dashboard_summary, recommendations = extract_json_sections(parsed_json)
-                        print(f"✅ JSON found in markdown, split at {start_pos}: text={len(text_before)} chars")
-                        return text_before, dashboard_summary, recommendations, json_content
+                        result = _split_text_and_json(trimmed, start_pos, json_content)
+                        logger.debug("✅ JSON found in markdown, split at %d: text=%d chars", start_pos, len(result[0]))
+                        return result
                     except:
                         pass
         
-        # If no markdown, find JSON starting with { or [
-        for i, char in enumerate(trimmed):
-            if char in '{[':  # JSON starts here
-                depth = 1
-                for j in range(i + 1, len(trimmed)):
-                    if trimmed[j] in '{[':
-                        depth += 1
-                    elif trimmed[j] in '}]':
-                        depth -= 1
-                        if depth == 0:  # Found complete JSON
-                            json_content = trimmed[i:j+1]
-                            text_before = trimmed[:i].strip()  # TEXT STOPS HERE - before JSON starts
-                            try:
-                                parsed_json = json.loads(json_content)  # Validate JSON
-                                dashboard_summary, recommendations = extract_json_sections(parsed_json)
-                                print(f"✅ JSON found, split at {i}: text={len(text_before)} chars")
-                                return text_before, dashboard_summary, recommendations, json_content
-                            except:
-                                break
-                break
+        # If no markdown, find JSON starting with { or [ (whichever comes first)
+        brace_pos = trimmed.find('{')
+        bracket_pos = trimmed.find('[')
+        i = brace_pos if bracket_pos == -1 or (brace_pos != -1 and brace_pos < bracket_pos) else bracket_pos
+        if i != -1:  # JSON starts here
+            # raw_decode finds the end of the value and parses it in one C-level pass
+            try:
+                parsed_json, end = _DECODER.raw_decode(trimmed, i)
+            except ValueError:
+                pass
+            else:
+                # TEXT STOPS HERE - before JSON starts
+                result = _text_and_json_result(trimmed, i, parsed_json, trimmed[i:end])
+                logger.debug("✅ JSON found, split at %d: text=%d chars", i, len(result[0]))
+                return result
         
         # No JSON found
-        print(f"ℹ️ No JSON found in LLM response")
-        return trimmed, "", "", ""  # Return everything as text, no JSON
+        logger.debug("ℹ️ No JSON found in LLM response")
+        return trimmed, [], [], ""  # Return everything as text, no JSON
         
+    except Exception as e:
+        print(f"❌ Error extracting text and JSON: {e}")
+        return llm_response, [], [], ""
+
+
+def extract_text_and_json(llm_response: str) -> Tuple[str, str, str, str]:
+    """
+    Extract and separate text from JSON in the LLM response.
+    Parses JSON to extract DashboardSummary and Recommendations separately.
+    
+    Returns:
+        tuple: (text_part, dashboard_summary_json, recommendations_json, raw_json_string) where:
+            text_part: Text content BEFORE JSON starts (for full_information)
+            dashboard_summary_json: JSON array of DashboardSummary (for summary cards)
+            recommendations_json: JSON array of Recommendations (for recommendations table)
+            raw_json_string: Raw JSON string as extracted (for information_json storage)
+    
+    Results for responses shorter than _MAX_CACHED_RESPONSE_LEN are memoized.
+    """
+    if isinstance(llm_response, str) and len(llm_response) < _MAX_CACHED_RESPONSE_LEN:
+        return _extract_text_and_json_cached(llm_response)
+    return _text_and_json_strings(llm_response, _extract_text_and_json(llm_response))
+
+
+def extract_text_and_json_raw(llm_response: str) -> Tuple[str, Any, Any, str]:
+    """
+    Like extract_text_and_json, but returns the DashboardSummary and Recommendations
+    sections as parsed Python values ([] when missing) instead of JSON strings.
+    
+    Use this when the sections are consumed as objects (e.g. passed straight to
+    save_recommendations_from_json) to skip a serialize/parse round trip. Results are
+    memoized like extract_text_and_json, so treat the returned objects as read-only.
+    
+    Returns:
+        tuple: (text_part, dashboard_summary, recommendations, raw_json_string)
+    """
+    if isinstance(llm_response, str) and len(llm_response) < _MAX_CACHED_RESPONSE_LEN:
+        return _extract_text_and_json_raw_cached(llm_response)
+    return _extract_text_and_json(llm_response)
+
+
+def _text_and_json_strings(llm_response: str, result: Tuple[str, Any, Any, str]) -> Tuple[str, str, str, str]:
+    """Serialize the sections of an extract_text_and_json_raw result; never raises."""
+    text_part, dashboard_summary, recommendations, raw_json_string = result
+    try:
+        return text_part, _dumps_section(dashboard_summary), _dumps_section(recommendations), raw_json_string
     except Exception as e:
         print(f"❌ Error extracting text and JSON: {e}")
         return llm_response, "", "", ""
 
 
+@lru_cache(maxsize=64)
+def _extract_text_and_json_raw_cached(llm_response: str) -> Tuple[str, Any, Any, str]:
+    return _extract_text_and_json(llm_response)
+
+
+@lru_cache(maxsize=64)
+def _extract_text_and_json_cached(llm_response: str) -> Tuple[str, str, str, str]:
+    return _text_and_json_strings(llm_response, _extract_text_and_json_raw_cached(llm_response))
+
+
 def extract_review_section(llm_response: str) -> str | None:
     """
     Extract the review section from LLM response using shared markers.
@@ -351,6 +550,17 @@ def extract_review_section(llm_response: str) -> str | None:
         str: The extracted review section between START_MARKER and END_MARKER,
              or None if start marker not found, empty string if end marker not found
     """
+    if isinstance(llm_response, str) and len(llm_response) < _MAX_CACHED_RESPONSE_LEN:
+        return _extract_review_section_cached(llm_response)
+    return extract_content_between_markers(
+        llm_response,
+        LLM_EXTRACTION_CONSTANTS.START_MARKER,
+        LLM_EXTRACTION_CONSTANTS.END_MARKER
+    )
+
+
+@lru_cache(maxsize=64)
+def _extract_review_section_cached(llm_response: str) -> str | None:
     return extract_content_between_markers(
         llm_response,
         LLM_EXTRACTION_CONSTANTS.START_MARKER,
@@ -369,6 +579,81 @@ def extract_pi_sync_review(llm_response: str) -> str | None:
     return extract_review_section(llm_response)
 
 
+# Per-card-type upsert wiring: APIClient method names and the lookup key for a card.
+# The same key function is applied to stored cards and to the new payload (whose date is today).
+_CARD_UPSERT_SPECS: Dict[str, Dict[str, Any]] = {
+    "PI": {
+        "list": "list_pi_ai_cards",
+        "patch": "patch_pi_ai_card",
+        "create": "create_pi_ai_card",
+        "label": "pi-ai-card",
+        "key": lambda c: (c.get("team_name"), c.get("pi"), c.get("card_name"), str(c.get("date", ""))[:10]),
+    },
+    "Team": {
+        "list": "list_team_ai_cards",
+        "patch": "patch_team_ai_card",
+        "create": "create_team_ai_card",
+        "label": "team-ai-card",
+        "key": lambda c: (c.get("team_name"), c.get("card_name"), str(c.get("date", ""))[:10]),
+    },
+}
+
+# (base_url, card_type) -> (date, fetched_at, {lookup_key: card}); shared by all teams in
+# a run. Only the latest date is kept per key, so the agent process does not accumulate
+# past days' indexes. Cards created by other writers (another agent replica, the UI)
+# within the TTL are missing from a cached index, which is why a miss is re-checked
+# with a fresh list before creating a card.
+_CARDS_CACHE_TTL_SECONDS = 60
+_cards_cache: Dict[Tuple[str, str], Tuple[str, float, Dict[Tuple[Any, ...], Dict[str, Any]]]] = {}
+
+
+def _get_card_index(
+    client: APIClient,
+    card_type: str,
+    today: str,
+    refresh: bool = False,
+) -> Tuple[Dict[Tuple[Any, ...], Dict[str, Any]], bool]:
+    """
+    Return today's cards of the given type indexed by their lookup key.
+    
+    The list is fetched with only the date filter so one fetch serves every team in a
+    batch job, and is reused for up to _CARDS_CACHE_TTL_SECONDS. Failed fetches are not cached.
+    
+    Args:
+        client: APIClient instance
+        card_type: "PI" or "Team"
+        today: Card date (YYYY-MM-DD)
+        refresh: Ignore the cached index and fetch the list again
+    
+    Returns:
+        Tuple of (dict mapping lookup key tuples to card dicts, first card winning for
+        duplicate keys; True if the dict came from the cache rather than a fresh list)
+    """
+    cache_key = (client.base_url, card_type)
+    cached = _cards_cache.get(cache_key)
+    now = time.monotonic()
+    if not refresh and cached is not None and cached[0] == today and now - cached[1] < _CARDS_CACHE_TTL_SECONDS:
+        return cached[2], True
+    # Expired, other-date or refreshed entries are dropped even if the fetch below fails
+    _cards_cache.pop(cache_key, None)
+
+    spec = _CARD_UPSERT_SPECS[card_type]
+    sc, cards = getattr(client, spec["list"])(date=today)
+    if sc != 200 or not isinstance(cards, dict):
+        return {}, False
+    items = cards.get("data") or cards
+    if not isinstance(items, list):
+        return {}, False
+
+    key_fn = spec["key"]
+    cards_by_key: Dict[Tuple[Any, ...], Dict[str, Any]] = {}
+    for c in items:
+        if isinstance(c, dict):
+            cards_by_key.setdefault(key_fn(c), c)
+    _cards_cache[cache_key] = (today, now, cards_by_key)
+    return cards_by_key, False
+
+
 def process_llm_response_and_save_ai_card(
     client: APIClient,
     llm_answer: str,
@@ -396,7 +681,7 @@ def process_llm_response_and_save_ai_card(
     from datetime import datetime, timezone
     
     # Extract and separate text from JSON
-    full_information, dashboard_summary_json, recommendations_json, raw_json_string = extract_text_and_json(llm_answer)
+    full_information, _, _, raw_json_string = extract_text_and_json_raw(llm_answer)
     
     # Extract description using provided function
     extracted_content = extract_content_fn(llm_answer)
@@ -430,58 +715,36 @@ def process_llm_response_and_save_ai_card(
         card_payload["information_json"] = raw_json_string
     
     # Upsert card based on type and extract card_id
-    upsert_done = False
     card_id = None
-    if card_type == "PI":
-        sc, cards = client.list_pi_ai_cards()
-        if sc == 200 and isinstance(cards, dict):
-            items = cards.get("data") or cards
-            if isinstance(items, list):
-                for c in items:
-                    try:
-                        same_date = str(c.get("date", ""))[:10] == today
-                        if same_date and c.get("team_name") == card_payload["team_name"] and c.get("pi") == card_payload.get("pi") and c.get("card_name") == card_payload["card_name"]:
-                            # Patch existing
-                            card_id = int(c.get("id"))
-                            psc, presp = client.patch_pi_ai_card(card_id, card_payload)
-                            if psc >= 300:
-                                print(f"⚠️ Patch pi-ai-card failed: {psc} {presp}")
-                            upsert_done = psc < 300
-                            break
-                    except Exception:
-                        continue
-        if not upsert_done:
-            csc, cresp = client.create_pi_ai_card(card_payload)
-            if csc < 300 and isinstance(cresp, dict):
-                # Extract from response.data.card.id structure
-                card_id = cresp.get("data", {}).get("card", {}).get("id")
-            elif csc >= 300:
-                print(f"⚠️ Create pi-ai-card failed: {csc} {cresp}")
-    elif card_type == "Team":
-        sc, cards = client.list_team_ai_cards()
-        if sc == 200 and isinstance(cards, dict):
-            items = cards.get("data") or cards
-            if isinstance(items, list):
-                for c in items:
-                    try:
-                        same_date = str(c.get("date", ""))[:10] == today
-                        if same_date and c.get("team_name") == card_payload["team_name"] and c.get("card_name") == card_payload["card_name"]:
-                            # Patch existing
-                            card_id = int(c.get("id"))
-                            psc, presp = client.patch_team_ai_card(card_id, card_payload)
-                            if psc >= 300:
-                                print(f"⚠️ Patch team-ai-card failed: {psc} {presp}")
-                            upsert_done = psc < 300
-                            break
-                    except Exception:
-                        continue
+    spec = _CARD_UPSERT_SPECS.get(card_type)
+    if spec is not None:
+        label = spec["label"]
+        upsert_done = False
+        card_key = spec["key"](card_payload)
+        cards_by_key, from_cache = _get_card_index(client, card_type, today)
+        existing = cards_by_key.get(card_key)
+        if existing is None and from_cache:
+            # The cached index may predate a card created elsewhere; re-list before creating
+            existing = _get_card_index(client, card_type, today, refresh=True)[0].get(card_key)
+        if existing is not None:
+            try:
+                # Patch existing
+                card_id = int(existing.get("id"))
+                psc, presp = getattr(client, spec["patch"])(card_id, card_payload)
+                if psc >= 300:
+                    print(f"⚠️ Patch {label} failed: {psc} {presp}")
+                upsert_done = psc < 300
+            except Exception:
+                pass
         if not upsert_done:
-            csc, cresp = client.create_team_ai_card(card_payload)
+            csc, cresp = getattr(client, spec["create"])(card_payload)
             if csc < 300 and isinstance(cresp, dict):
                 # Extract from response.data.card.id structure
                 card_id = cresp.get("data", {}).get("card", {}).get("id")
+                # The cached index no longer reflects today's cards
+                _cards_cache.pop((client.base_url, card_type), None)
             elif csc >= 300:
-                print(f"⚠️ Create team-ai-card failed: {csc} {cresp}")
+                print(f"⚠️ Create {label} failed: {csc} {cresp}")
     
     # Short log of the created card insight
     desc_preview = (card_payload["description"] or "")[:120]
@@ -491,7 +754,7 @@ def process_llm_response_and_save_ai_card(
     
     # Log card_id for debugging
     if card_id is not None:
-        print(f"✅ Card ID extracted: {card_id}")
+        logger.debug("✅ Card ID extracted: %s", card_id)
     else:
         print(f"⚠️ WARNING: Card ID is None - source_ai_summary_id will be None in recommendations")
     
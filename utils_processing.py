@@ -42,7 +42,9 @@ from utils_llm_processing_and_extraction import (
     LLM_EXTRACTION_CONSTANTS,
     extract_content_between_markers,
     extract_json_sections,
+    extract_json_sections_raw,
     extract_text_and_json,
+    extract_text_and_json_raw,
     extract_review_section,
     extract_daily_progress_review,  # Backward compatibility
     extract_pi_sync_review,  # Backward compatibility
@@ -77,7 +79,9 @@ __all__ = [
     "LLM_EXTRACTION_CONSTANTS",
     "extract_content_between_markers",
     "extract_json_sections",
+    "extract_json_sections_raw",
     "extract_text_and_json",
+    "extract_text_and_json_raw",
     "extract_review_section",
     "extract_daily_progress_review",  # Backward compatibility
     "extract_pi_sync_review",  # Backward compatibility